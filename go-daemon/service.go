@@ -1,6 +1,7 @@
 package main
 
 import (
+	"crypto/sha256"
 	"fmt"
 	"log"
 	"os"
@@ -17,7 +18,10 @@ import (
 type Service struct {
 	config          *Config
 	configPath      string
+	configStamp     configStamp
+	configHash      [sha256.Size]byte
 	engineCmd       *exec.Cmd
+	engineDone      chan struct{} // closed once engineCmd has exited
 	engineStopped   bool // true = intentional stop, don't auto-restart
 	watcher         *fsnotify.Watcher
 	stopChan        chan struct{}
@@ -38,6 +42,13 @@ type Config struct {
 	Hotkey           string               `yaml:"hotkey"`
 }
 
+// configStamp identifies the on-disk version of the config file, so an
+// unchanged file can be detected with a stat instead of a read and parse.
+type configStamp struct {
+	modTime int64 // UnixNano
+	size    int64
+}
+
 // AppConfig represents per-application configuration
 type AppConfig struct {
 	Enabled     bool  `yaml:"enabled"`
@@ -53,6 +64,10 @@ type Stats struct {
 	LastReload         time.Time
 }
 
+// engineStopTimeout bounds how long Reload waits for the old engine to exit
+// before starting its replacement.
+const engineStopTimeout = 2 * time.Second
+
 // NewService creates a new service instance
 func NewService() *Service {
 	homeDir, _ := os.UserHomeDir()
@@ -92,7 +107,7 @@ func findBinary(name string) (string, error) {
 func (s *Service) Start() error {
 	log.Println("Starting SmartType service...")
 
-	if err := s.loadConfig(); err != nil {
+	if _, err := s.loadConfig(); err != nil {
 		return fmt.Errorf("failed to load config: %w", err)
 	}
 
@@ -142,21 +157,27 @@ func (s *Service) Stop() {
 func (s *Service) Reload() error {
 	log.Println("Reloading configuration...")
 
-	if err := s.loadConfig(); err != nil {
+	if _, err := s.loadConfig(); err != nil {
 		return fmt.Errorf("failed to reload config: %w", err)
 	}
 
 	s.mu.Lock()
 	s.engineStopped = true
 	oldEngine := s.engineCmd
+	oldDone := s.engineDone
 	s.mu.Unlock()
 
 	if oldEngine != nil && oldEngine.Process != nil {
 		oldEngine.Process.Signal(os.Interrupt)
+		// The old engine must release its IBus name before the new one can
+		// claim it. Wait for its exit notification instead of a fixed sleep.
+		select {
+		case <-oldDone:
+		case <-time.After(engineStopTimeout):
+			log.Printf("Engine did not exit within %v, starting new one anyway", engineStopTimeout)
+		}
 	}
 
-	time.Sleep(400 * time.Millisecond)
-
 	s.mu.Lock()
 	s.engineStopped = false
 	s.mu.Unlock()
@@ -173,6 +194,20 @@ func (s *Service) Reload() error {
 	return nil
 }
 
+// reloadIfChanged reloads only when the config content differs from what is
+// loaded, so re-saving an unchanged file does not restart the engine
+func (s *Service) reloadIfChanged() error {
+	changed, err := s.loadConfig()
+	if err != nil {
+		return fmt.Errorf("failed to reload config: %w", err)
+	}
+	if !changed {
+		log.Println("Config content unchanged, skipping reload")
+		return nil
+	}
+	return s.Reload()
+}
+
 // startEngine starts (or restarts) the IBus engine process.
 // A monitoring goroutine auto-restarts it on unexpected exit.
 func (s *Service) startEngine() error {
@@ -193,21 +228,28 @@ func (s *Service) startEngine() error {
 		return fmt.Errorf("start engine: %w", err)
 	}
 
+	done := make(chan struct{})
+
 	s.mu.Lock()
 	s.engineCmd = cmd
+	s.engineDone = done
 	s.mu.Unlock()
 
 	log.Printf("Engine started (PID %d)", cmd.Process.Pid)
 
 	s.wg.Add(1)
-	go func(c *exec.Cmd) {
+	go func(c *exec.Cmd, done chan struct{}) {
 		defer s.wg.Done()
-		if err := c.Wait(); err != nil {
-			log.Printf("Engine exited: %v", err)
-		}
+		err := c.Wait()
 		s.mu.RLock()
 		stopped := s.engineStopped
 		s.mu.RUnlock()
+		// Sample engineStopped before announcing the exit: Reload clears it
+		// as soon as done is closed.
+		close(done)
+		if err != nil {
+			log.Printf("Engine exited: %v", err)
+		}
 		if stopped {
 			return
 		}
@@ -225,32 +267,81 @@ func (s *Service) startEngine() error {
 				}
 			}
 		}
-	}(cmd)
+	}(cmd, done)
 
 	return nil
 }
 
-// loadConfig loads configuration from file
-func (s *Service) loadConfig() error {
-	data, err := os.ReadFile(s.configPath)
+// statConfig returns the current stamp of the config file
+func (s *Service) statConfig() (configStamp, error) {
+	info, err := os.Stat(s.configPath)
+	if err != nil {
+		return configStamp{}, err
+	}
+	return configStamp{modTime: info.ModTime().UnixNano(), size: info.Size()}, nil
+}
+
+// configModified reports whether the config file differs from the last
+// version loaded. Errors count as modified so the caller surfaces them.
+func (s *Service) configModified() bool {
+	stamp, err := s.statConfig()
+	if err != nil {
+		return true
+	}
+
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+	return s.config == nil || stamp != s.configStamp
+}
+
+// loadConfig loads configuration from file and reports whether its content
+// changed. The read is skipped when the file's stamp is unchanged, and the
+// parse when its content hashes the same as the last load.
+func (s *Service) loadConfig() (bool, error) {
+	stamp, err := s.statConfig()
 	if err != nil {
 		if os.IsNotExist(err) {
 			s.config = s.defaultConfig()
-			return s.saveConfig()
+			return true, s.saveConfig()
 		}
-		return err
+		return false, err
+	}
+
+	s.mu.RLock()
+	unchanged := s.config != nil && stamp == s.configStamp
+	s.mu.RUnlock()
+	if unchanged {
+		return false, nil
+	}
+
+	data, err := os.ReadFile(s.configPath)
+	if err != nil {
+		return false, err
+	}
+
+	hash := sha256.Sum256(data)
+	s.mu.Lock()
+	sameContent := s.config != nil && hash == s.configHash
+	if sameContent {
+		s.configStamp = stamp
+	}
+	s.mu.Unlock()
+	if sameContent {
+		return false, nil
 	}
 
 	config := &Config{}
 	if err := yaml.Unmarshal(data, config); err != nil {
-		return err
+		return false, err
 	}
 
 	s.mu.Lock()
 	s.config = config
+	s.configStamp = stamp
+	s.configHash = hash
 	s.mu.Unlock()
 
-	return nil
+	return true, nil
 }
 
 // saveConfig saves configuration to file
@@ -265,7 +356,35 @@ func (s *Service) saveConfig() error {
 		return err
 	}
 
-	return os.WriteFile(s.configPath, data, 0644)
+	return writeFileAtomic(s.configPath, data, 0644)
+}
+
+// writeFileAtomic writes data to a temporary sibling of path in a single
+// write, syncs it and renames it into place, so readers never see a
+// partially written file.
+func writeFileAtomic(path string, data []byte, perm os.FileMode) error {
+	tmpPath := path + ".tmp"
+	f, err := os.OpenFile(tmpPath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, perm)
+	if err != nil {
+		return err
+	}
+
+	if _, err := f.Write(data); err != nil {
+		f.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := f.Sync(); err != nil {
+		f.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := f.Close(); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+
+	return os.Rename(tmpPath, path)
 }
 
 // defaultConfig returns the default configuration
@@ -307,18 +426,41 @@ func (s *Service) setupWatcher() error {
 	return watcher.Add(configDir)
 }
 
+// reloadDebounce is how long the config file must be quiet before a change
+// triggers a reload. A single editor save emits several events (truncate,
+// write, chmod); each reload restarts the engine, so they are coalesced.
+const reloadDebounce = 500 * time.Millisecond
+
 // watchConfig watches for configuration file changes and reloads
 func (s *Service) watchConfig() {
 	defer s.wg.Done()
 
+	debounce := time.NewTimer(reloadDebounce)
+	debounce.Stop()
+	defer debounce.Stop()
+
 	for {
 		select {
 		case event := <-s.watcher.Events:
-			if event.Name == s.configPath && event.Op&fsnotify.Write == fsnotify.Write {
-				log.Println("Config file changed, reloading...")
-				if err := s.Reload(); err != nil {
-					log.Printf("Error reloading config: %v", err)
+			// Atomic saves rename a temp file into place, which shows up as
+			// Create rather than Write.
+			if event.Name == s.configPath && event.Op&(fsnotify.Write|fsnotify.Create) != 0 {
+				if !s.configModified() {
+					continue
+				}
+				// Restart the countdown; a burst of events ends in one reload.
+				if !debounce.Stop() {
+					select {
+					case <-debounce.C:
+					default:
+					}
 				}
+				debounce.Reset(reloadDebounce)
+			}
+		case <-debounce.C:
+			log.Println("Config file changed, reloading...")
+			if err := s.reloadIfChanged(); err != nil {
+				log.Printf("Error reloading config: %v", err)
 			}
 		case err := <-s.watcher.Errors:
 			log.Printf("Watcher error: %v", err)
@@ -139,12 +139,15 @@ impl WordCompleter {
 
         for path in &["/usr/share/dict/words", "/usr/share/dict/american-english"] {
             if let Ok(content) = std::fs::read_to_string(path) {
-                for word in content.lines() {
-                    let w = word.to_lowercase();
-                    if w.len() >= 2 && w.len() <= 20 && w.chars().all(|c| c.is_ascii_alphabetic()) {
-                        words.entry(w).or_insert(100);
-                    }
-                }
+                // Build the map in one go: collecting into a BTreeMap sorts the
+                // entries once and bulk-loads the tree, instead of ~100k
+                // separate inserts each walking down from the root.
+                words = content
+                    .lines()
+                    .map(str::to_lowercase)
+                    .filter(|w| w.len() >= 2 && w.len() <= 20 && w.chars().all(|c| c.is_ascii_alphabetic()))
+                    .map(|w| (w, 100))
+                    .collect();
                 log::info!("Loaded system wordlist from {}", path);
                 break;
             }
@@ -164,6 +167,12 @@ impl WordCompleter {
         Self { words, learned, learned_path }
     }
 
+    /// A completer with no words and no persistence, usable as a placeholder
+    /// while `new()` loads the real wordlist elsewhere.
+    pub fn empty() -> Self {
+        Self { words: BTreeMap::new(), learned: HashMap::new(), learned_path: None }
+    }
+
     // ── Lookup ────────────────────────────────────────────────────────────────
 
     pub fn contains(&self, word: &str) -> bool {
@@ -190,12 +199,16 @@ impl WordCompleter {
             .collect();
 
         if candidates.len() < max_count && pl.len() >= 3 {
-            let mut seen: HashSet<String> =
-                candidates.iter().map(|(w, _, _)| w.clone()).collect();
-            seen.insert(pl.clone());
+            // Anything starting with the prefix is already a candidate (or the
+            // prefix itself). Dedup the rest by borrowing the map's keys, so
+            // only hits are recorded and the hundreds of misses aren't copied.
+            let mut seen: HashSet<&str> = HashSet::new();
             for c in generate_edit1(&pl) {
-                if seen.insert(c.clone()) {
-                    if let Some(&freq) = self.words.get(&c) {
+                if c.starts_with(pl.as_str()) {
+                    continue;
+                }
+                if let Some((word, &freq)) = self.words.get_key_value(&c) {
+                    if seen.insert(word.as_str()) {
                         candidates.push((c, freq, 1));
                     }
                 }
@@ -216,13 +229,14 @@ impl WordCompleter {
             return Vec::new();
         }
 
-        let mut seen: HashSet<String> = HashSet::new();
-        seen.insert(wl.clone());
+        // `wl` itself is not in the map (checked above), so only dictionary
+        // hits need deduping; borrow their keys rather than cloning every probe.
+        let mut seen: HashSet<&str> = HashSet::new();
         let mut candidates: Vec<(String, u32, u8)> = Vec::new();
 
         for c in generate_edit1(&wl) {
-            if seen.insert(c.clone()) {
-                if let Some(&freq) = self.words.get(&c) {
+            if let Some((word, &freq)) = self.words.get_key_value(&c) {
+                if seen.insert(word.as_str()) {
                     candidates.push((c, freq, 1));
                 }
             }
@@ -235,8 +249,8 @@ impl WordCompleter {
                     if candidates.len() >= max_count * 4 {
                         break 'outer;
                     }
-                    if seen.insert(c.clone()) {
-                        if let Some(&freq) = self.words.get(&c) {
+                    if let Some((word, &freq)) = self.words.get_key_value(&c) {
+                        if seen.insert(word.as_str()) {
                             candidates.push((c, freq, 2));
                         }
                     }
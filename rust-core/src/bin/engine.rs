@@ -131,16 +131,19 @@ impl EngineState {
         Self { word_buffer: String::new(), suggestions: Vec::new() }
     }
 
+    /// Refills the existing suggestion buffer in place rather than allocating
+    /// a fresh Vec on every keystroke.
     fn refresh_suggestions(&mut self, completer: &WordCompleter) {
-        self.suggestions = if self.word_buffer.len() >= MIN_PREFIX_LEN {
-            completer
-                .suggest(&self.word_buffer, MAX_SUGGESTIONS)
-                .into_iter()
-                .map(|s| match_case(&self.word_buffer, &s))
-                .collect()
-        } else {
-            Vec::new()
-        };
+        self.suggestions.clear();
+        if self.word_buffer.len() >= MIN_PREFIX_LEN {
+            let prefix = &self.word_buffer;
+            self.suggestions.extend(
+                completer
+                    .suggest(prefix, MAX_SUGGESTIONS)
+                    .into_iter()
+                    .map(|s| match_case(prefix, s)),
+            );
+        }
     }
 
     fn clear(&mut self) {
@@ -168,6 +171,51 @@ impl SmartEngine {
             autocorrect_fn,
         }
     }
+
+    // Helpers shared by the D-Bus methods below. They live outside the
+    // #[interface] block so they are not exported over D-Bus.
+
+    /// Hides the preedit text and the candidate window.
+    async fn hide_all(ctxt: &SignalContext<'_>) {
+        let _ = Self::hide_pre_edit_text(ctxt).await;
+        let _ = Self::hide_lookup_table(ctxt).await;
+    }
+
+    /// Hides the preedit and candidate window, then commits `text` to the app.
+    async fn hide_and_commit(ctxt: &SignalContext<'_>, text: String) {
+        Self::hide_all(ctxt).await;
+        let _ = Self::commit_text(ctxt, &ibus_text(text)).await;
+    }
+
+    /// Shows `word` as preedit and `suggestions` in the candidate window,
+    /// hiding the window when there is nothing to suggest.
+    async fn show_preedit(ctxt: &SignalContext<'_>, word: String, suggestions: &[String]) {
+        let cursor = word.chars().count() as u32;
+        if let Err(e) = Self::update_pre_edit_text(
+            ctxt,
+            &ibus_text(word),
+            cursor,
+            true,
+            IBUS_ENGINE_PREEDIT_COMMIT,
+        )
+        .await
+        {
+            log::error!("update_pre_edit_text failed: {}", e);
+        }
+        if suggestions.is_empty() {
+            let _ = Self::hide_lookup_table(ctxt).await;
+        } else if let Err(e) =
+            Self::update_lookup_table(ctxt, &ibus_lookup_table(suggestions), true).await
+        {
+            log::error!("update_lookup_table failed: {}", e);
+        }
+    }
+
+    /// Drops any pending input and hides the preedit and candidate window.
+    async fn discard(&self, ctxt: &SignalContext<'_>) {
+        self.state.lock().await.clear();
+        Self::hide_all(ctxt).await;
+    }
 }
 
 #[interface(name = "org.freedesktop.IBus.Engine")]
@@ -201,9 +249,7 @@ impl SmartEngine {
                 let word = std::mem::take(&mut st.word_buffer);
                 st.clear();
                 drop(st);
-                let _ = Self::hide_pre_edit_text(&ctxt).await;
-                let _ = Self::hide_lookup_table(&ctxt).await;
-                let _ = Self::commit_text(&ctxt, &ibus_text(word)).await;
+                Self::hide_and_commit(&ctxt, word).await;
             }
             return false;
         }
@@ -214,23 +260,10 @@ impl SmartEngine {
         if keyval == KEY_BACKSPACE && !st.word_buffer.is_empty() {
             st.word_buffer.pop();
             st.refresh_suggestions(&self.completer.read().unwrap());
-            let preedit = ibus_text(st.word_buffer.clone());
-            let cursor = st.word_buffer.chars().count() as u32;
+            let word = st.word_buffer.clone();
             let sugg = st.suggestions.clone();
             drop(st);
-            let _ = Self::update_pre_edit_text(
-                &ctxt,
-                &preedit,
-                cursor,
-                true,
-                IBUS_ENGINE_PREEDIT_COMMIT,
-            )
-            .await;
-            if sugg.is_empty() {
-                let _ = Self::hide_lookup_table(&ctxt).await;
-            } else {
-                let _ = Self::update_lookup_table(&ctxt, &ibus_lookup_table(&sugg), true).await;
-            }
+            Self::show_preedit(&ctxt, word, &sugg).await;
             return true;
         }
 
@@ -239,9 +272,7 @@ impl SmartEngine {
             let chosen = st.suggestions[0].clone();
             st.clear();
             drop(st);
-            let _ = Self::hide_pre_edit_text(&ctxt).await;
-            let _ = Self::hide_lookup_table(&ctxt).await;
-            let _ = Self::commit_text(&ctxt, &ibus_text(chosen)).await;
+            Self::hide_and_commit(&ctxt, chosen).await;
             return true;
         }
 
@@ -251,9 +282,7 @@ impl SmartEngine {
             if let Some(chosen) = st.suggestions.get(idx).cloned() {
                 st.clear();
                 drop(st);
-                let _ = Self::hide_pre_edit_text(&ctxt).await;
-                let _ = Self::hide_lookup_table(&ctxt).await;
-                let _ = Self::commit_text(&ctxt, &ibus_text(chosen)).await;
+                Self::hide_and_commit(&ctxt, chosen).await;
                 return true;
             }
         }
@@ -263,11 +292,10 @@ impl SmartEngine {
             let word = std::mem::take(&mut st.word_buffer);
             st.clear();
             drop(st);
-            let _ = Self::hide_pre_edit_text(&ctxt).await;
-            let _ = Self::hide_lookup_table(&ctxt).await;
+            Self::hide_all(&ctxt).await;
             if !word.is_empty() {
                 let committed = match (self.autocorrect_fn)(&word) {
-                    Some(c) => match_case(&word, &c),
+                    Some(c) => match_case(&word, c),
                     None => word,
                 };
                 let delimiter = if keyval == KEY_SPACE { " " } else { "\n" };
@@ -299,9 +327,7 @@ impl SmartEngine {
                 let word = std::mem::take(&mut st.word_buffer);
                 st.clear();
                 drop(st);
-                let _ = Self::hide_pre_edit_text(&ctxt).await;
-                let _ = Self::hide_lookup_table(&ctxt).await;
-                let _ = Self::commit_text(&ctxt, &ibus_text(word)).await;
+                Self::hide_and_commit(&ctxt, word).await;
             }
             return false;
         }
@@ -311,28 +337,10 @@ impl SmartEngine {
             if ch.is_alphabetic() || ch == '\'' {
                 st.word_buffer.push(ch);
                 st.refresh_suggestions(&self.completer.read().unwrap());
-                let preedit = ibus_text(st.word_buffer.clone());
-                let cursor = st.word_buffer.chars().count() as u32;
+                let word = st.word_buffer.clone();
                 let sugg = st.suggestions.clone();
                 drop(st);
-                if let Err(e) = Self::update_pre_edit_text(
-                    &ctxt,
-                    &preedit,
-                    cursor,
-                    true,
-                    IBUS_ENGINE_PREEDIT_COMMIT,
-                )
-                .await
-                {
-                    log::error!("update_pre_edit_text failed: {}", e);
-                }
-                if sugg.is_empty() {
-                    let _ = Self::hide_lookup_table(&ctxt).await;
-                } else if let Err(e) =
-                    Self::update_lookup_table(&ctxt, &ibus_lookup_table(&sugg), true).await
-                {
-                    log::error!("update_lookup_table failed: {}", e);
-                }
+                Self::show_preedit(&ctxt, word, &sugg).await;
                 return true;
             }
             // Non-alpha printable: flush any buffered preedit then pass through.
@@ -340,9 +348,7 @@ impl SmartEngine {
                 let word = std::mem::take(&mut st.word_buffer);
                 st.clear();
                 drop(st);
-                let _ = Self::hide_pre_edit_text(&ctxt).await;
-                let _ = Self::hide_lookup_table(&ctxt).await;
-                let _ = Self::commit_text(&ctxt, &ibus_text(word)).await;
+                Self::hide_and_commit(&ctxt, word).await;
             }
         }
 
@@ -350,27 +356,15 @@ impl SmartEngine {
     }
 
     async fn focus_out(&self, #[zbus(signal_context)] ctxt: SignalContext<'_>) {
-        let mut st = self.state.lock().await;
-        st.clear();
-        drop(st);
-        let _ = Self::hide_pre_edit_text(&ctxt).await;
-        let _ = Self::hide_lookup_table(&ctxt).await;
+        self.discard(&ctxt).await;
     }
 
     async fn reset(&self, #[zbus(signal_context)] ctxt: SignalContext<'_>) {
-        let mut st = self.state.lock().await;
-        st.clear();
-        drop(st);
-        let _ = Self::hide_pre_edit_text(&ctxt).await;
-        let _ = Self::hide_lookup_table(&ctxt).await;
+        self.discard(&ctxt).await;
     }
 
     async fn disable(&self, #[zbus(signal_context)] ctxt: SignalContext<'_>) {
-        let mut st = self.state.lock().await;
-        st.clear();
-        drop(st);
-        let _ = Self::hide_pre_edit_text(&ctxt).await;
-        let _ = Self::hide_lookup_table(&ctxt).await;
+        self.discard(&ctxt).await;
     }
 
     async fn candidate_clicked(
@@ -384,9 +378,7 @@ impl SmartEngine {
         if let Some(chosen) = st.suggestions.get(index as usize).cloned() {
             st.clear();
             drop(st);
-            let _ = Self::hide_pre_edit_text(&ctxt).await;
-            let _ = Self::hide_lookup_table(&ctxt).await;
-            let _ = Self::commit_text(&ctxt, &ibus_text(chosen)).await;
+            Self::hide_and_commit(&ctxt, chosen).await;
         }
     }
 
@@ -437,9 +429,10 @@ impl SmartEngine {
 
 /// Recase a completer suggestion (always lowercase) to match how the user typed
 /// the prefix: "HEL" → "HELLO", "Hel" → "Hello", "hel" → "hello".
-fn match_case(prefix: &str, suggestion: &str) -> String {
+/// Takes the suggestion by value so the common lowercase case reuses it as-is.
+fn match_case(prefix: &str, suggestion: String) -> String {
     if !prefix.chars().any(|c| c.is_uppercase()) {
-        return suggestion.to_string();
+        return suggestion;
     }
     if prefix.chars().count() > 1 && prefix.chars().all(|c| c.is_uppercase()) {
         return suggestion.to_uppercase();
@@ -580,7 +573,17 @@ async fn main() -> Result<()> {
         let ac = Arc::clone(&ac_engine);
         move |word: &str| ac.read().unwrap().correct_word(word)
     });
-    let completer = Arc::new(RwLock::new(WordCompleter::new()));
+    // Loading the system wordlist reads and indexes ~100k words. Do it on a
+    // blocking thread while we connect to IBus and swap it in when done; until
+    // then keys are still buffered and autocorrected, just without suggestions.
+    let completer = Arc::new(RwLock::new(WordCompleter::empty()));
+    tokio::task::spawn_blocking({
+        let completer = Arc::clone(&completer);
+        move || {
+            let loaded = WordCompleter::new();
+            *completer.write().unwrap() = loaded;
+        }
+    });
 
     let addrs =
         find_ibus_addresses().context("IBus not running — start with: ibus-daemon -drx")?;
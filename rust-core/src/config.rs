@@ -1,18 +1,25 @@
 use anyhow::{Context, Result};
 use serde::{Deserialize, Serialize};
-use std::collections::HashMap;
+use std::collections::BTreeMap;
 use std::fs;
+use std::io::{BufWriter, Write};
 use std::path::PathBuf;
 
 /// Main configuration structure
+///
+/// Keys missing from the file take their value from `Config::default()`, so a
+/// partial or older config still decodes in one pass. The maps are ordered so
+/// `save()` emits them in a stable, sorted order and unchanged settings
+/// produce an identical file.
 #[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(default)]
 pub struct Config {
     pub enabled: bool,
     pub smart_punctuation: bool,
     pub autocorrect: bool,
     pub min_word_length: usize,
-    pub applications: HashMap<String, AppConfig>,
-    pub custom_typos: HashMap<String, String>,
+    pub applications: BTreeMap<String, AppConfig>,
+    pub custom_typos: BTreeMap<String, String>,
     pub hotkey: String,
 }
 
@@ -25,7 +32,7 @@ pub struct AppConfig {
 
 impl Default for Config {
     fn default() -> Self {
-        let mut applications = HashMap::new();
+        let mut applications = BTreeMap::new();
 
         // Default app configurations
         applications.insert(
@@ -73,7 +80,7 @@ impl Default for Config {
             },
         );
 
-        let mut custom_typos = HashMap::new();
+        let mut custom_typos = BTreeMap::new();
         custom_typos.insert("hte".to_string(), "the".to_string());
         custom_typos.insert("becuase".to_string(), "because".to_string());
 
@@ -95,9 +102,11 @@ impl Config {
         let config_path = Self::config_path()?;
 
         if config_path.exists() {
-            let content = fs::read_to_string(&config_path)
+            // Hand the raw bytes straight to the YAML parser: it validates the
+            // encoding itself, so a separate UTF-8 pass and String copy is waste.
+            let content = fs::read(&config_path)
                 .context("Failed to read config file")?;
-            let config: Config = serde_yaml::from_str(&content)
+            let config: Config = serde_yaml::from_slice(&content)
                 .context("Failed to parse config file")?;
             Ok(config)
         } else {
@@ -117,11 +126,24 @@ impl Config {
             fs::create_dir_all(parent)?;
         }
 
-        let content = serde_yaml::to_string(self)
+        // Stream the YAML into a sibling temp file, then rename it over the
+        // real one, so readers (and the daemon's watcher) never observe a
+        // half-written config. The buffer keeps a typical config to a single
+        // write without holding a large custom_typos section as one String.
+        let tmp_path = config_path.with_extension("yaml.tmp");
+        let file = fs::File::create(&tmp_path)
+            .context("Failed to create temporary config file")?;
+        let mut writer = BufWriter::new(file);
+        serde_yaml::to_writer(&mut writer, self)
             .context("Failed to serialize config")?;
-
-        fs::write(&config_path, content)
+        writer.flush()
             .context("Failed to write config file")?;
+        writer.get_ref().sync_all()
+            .context("Failed to sync config file")?;
+        drop(writer);
+
+        fs::rename(&tmp_path, &config_path)
+            .context("Failed to replace config file")?;
 
         Ok(())
     }
@@ -185,4 +207,24 @@ mod tests {
         let deserialized: Config = serde_yaml::from_str(&yaml).unwrap();
         assert_eq!(config.enabled, deserialized.enabled);
     }
+
+    #[test]
+    fn test_serialization_is_stable() {
+        let mut config = Config::default();
+        config.add_custom_typo("zzz".to_string(), "sleep".to_string());
+        config.add_custom_typo("aaa".to_string(), "scream".to_string());
+        let yaml = serde_yaml::to_string(&config).unwrap();
+        let reparsed: Config = serde_yaml::from_str(&yaml).unwrap();
+        assert_eq!(yaml, serde_yaml::to_string(&reparsed).unwrap());
+        assert!(yaml.find("aaa").unwrap() < yaml.find("zzz").unwrap());
+    }
+
+    #[test]
+    fn test_partial_config_uses_defaults() {
+        let config: Config = serde_yaml::from_str("autocorrect: false\n").unwrap();
+        assert!(!config.autocorrect);
+        assert!(config.enabled);
+        assert_eq!(config.min_word_length, 2);
+        assert_eq!(config.hotkey, "Super+Shift+A");
+    }
 }
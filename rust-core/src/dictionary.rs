@@ -1,10 +1,16 @@
 use phf::phf_map;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use anyhow::Result;
 
 /// Common typo dictionary
+///
+/// Built-in entries are looked up in the static `COMMON_TYPOS` map on demand;
+/// only user edits are materialised on the heap.
 pub struct Dictionary {
-    corrections: HashMap<String, String>,
+    /// User additions, including overrides of built-in entries
+    added: HashMap<String, String>,
+    /// Built-in typos the user has removed
+    removed: HashSet<String>,
 }
 
 /// Static dictionary of 2000+ common typos
@@ -1386,39 +1392,50 @@ static COMMON_TYPOS: phf::Map<&'static str, &'static str> = phf_map! {
 impl Dictionary {
     /// Load the dictionary
     pub fn load() -> Result<Self> {
-        let mut corrections = HashMap::new();
-
-        // Load built-in dictionary
-        for (typo, correction) in COMMON_TYPOS.entries() {
-            corrections.insert(typo.to_string(), correction.to_string());
-        }
-
-        Ok(Self { corrections })
+        Ok(Self {
+            added: HashMap::new(),
+            removed: HashSet::new(),
+        })
     }
 
     /// Get correction for a word
-    pub fn get(&self, word: &str) -> Option<&String> {
-        self.corrections.get(word)
+    pub fn get(&self, word: &str) -> Option<&str> {
+        if let Some(correction) = self.added.get(word) {
+            return Some(correction);
+        }
+        if self.removed.contains(word) {
+            return None;
+        }
+        COMMON_TYPOS.get(word).copied()
     }
 
     /// Add a custom correction
     pub fn add(&mut self, typo: String, correction: String) {
-        self.corrections.insert(typo, correction);
+        self.removed.remove(&typo);
+        self.added.insert(typo, correction);
     }
 
     /// Remove a correction
     pub fn remove(&mut self, typo: &str) {
-        self.corrections.remove(typo);
+        self.added.remove(typo);
+        if COMMON_TYPOS.contains_key(typo) {
+            self.removed.insert(typo.to_string());
+        }
     }
 
     /// Get dictionary size
     pub fn len(&self) -> usize {
-        self.corrections.len()
+        let extra = self
+            .added
+            .keys()
+            .filter(|typo| !COMMON_TYPOS.contains_key(typo.as_str()))
+            .count();
+        COMMON_TYPOS.len() - self.removed.len() + extra
     }
 
     /// Check if dictionary is empty
     pub fn is_empty(&self) -> bool {
-        self.corrections.is_empty()
+        self.len() == 0
     }
 }
 
@@ -1435,8 +1452,8 @@ mod tests {
     #[test]
     fn test_get_correction() {
         let dict = Dictionary::load().unwrap();
-        assert_eq!(dict.get("teh"), Some(&"the".to_string()));
-        assert_eq!(dict.get("recieve"), Some(&"receive".to_string()));
+        assert_eq!(dict.get("teh"), Some("the"));
+        assert_eq!(dict.get("recieve"), Some("receive"));
         assert_eq!(dict.get("nonexistent"), None);
     }
 
@@ -1447,10 +1464,28 @@ mod tests {
 
         dict.add("testtypo".to_string(), "testcorrection".to_string());
         assert_eq!(dict.len(), initial_size + 1);
-        assert_eq!(dict.get("testtypo"), Some(&"testcorrection".to_string()));
+        assert_eq!(dict.get("testtypo"), Some("testcorrection"));
 
         dict.remove("testtypo");
         assert_eq!(dict.len(), initial_size);
         assert_eq!(dict.get("testtypo"), None);
     }
+
+    #[test]
+    fn test_override_and_remove_builtin() {
+        let mut dict = Dictionary::load().unwrap();
+        let initial_size = dict.len();
+
+        dict.add("teh".to_string(), "tea".to_string());
+        assert_eq!(dict.len(), initial_size);
+        assert_eq!(dict.get("teh"), Some("tea"));
+
+        dict.remove("teh");
+        assert_eq!(dict.len(), initial_size - 1);
+        assert_eq!(dict.get("teh"), None);
+
+        dict.add("teh".to_string(), "the".to_string());
+        assert_eq!(dict.len(), initial_size);
+        assert_eq!(dict.get("teh"), Some("the"));
+    }
 }
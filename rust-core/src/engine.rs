@@ -5,6 +5,7 @@ use crate::Stats;
 use anyhow::Result;
 use regex::Regex;
 use std::collections::HashMap;
+use std::sync::OnceLock;
 
 /// Core autocorrect engine
 pub struct AutocorrectEngine {
@@ -13,7 +14,12 @@ pub struct AutocorrectEngine {
     config: Config,
     custom_corrections: HashMap<String, String>,
     stats: EngineStats,
-    word_boundary: Regex,
+}
+
+/// Word matcher shared by every engine instance, compiled on first use
+fn word_boundary() -> &'static Regex {
+    static WORD_BOUNDARY: OnceLock<Regex> = OnceLock::new();
+    WORD_BOUNDARY.get_or_init(|| Regex::new(r"\b\w+\b").unwrap())
 }
 
 #[derive(Debug, Clone, Default)]
@@ -24,10 +30,10 @@ struct EngineStats {
 
 impl AutocorrectEngine {
     /// Create new engine instance
-    pub fn new(config: Config) -> Result<Self> {
+    pub fn new(mut config: Config) -> Result<Self> {
         let dictionary = Dictionary::load()?;
         let smart_punctuation = SmartPunctuation::new();
-        let custom_corrections = Self::load_custom_corrections(&config)?;
+        let custom_corrections = Self::load_custom_corrections(&mut config)?;
 
         Ok(Self {
             dictionary,
@@ -35,7 +41,6 @@ impl AutocorrectEngine {
             config,
             custom_corrections,
             stats: EngineStats::default(),
-            word_boundary: Regex::new(r"\b\w+\b").unwrap(),
         })
     }
 
@@ -62,13 +67,16 @@ impl AutocorrectEngine {
             return None;
         }
 
+        // Lowercase once; both lookups key on it.
+        let lower = word.to_lowercase();
+
         // Check custom corrections first
-        if let Some(correction) = self.custom_corrections.get(&word.to_lowercase()) {
+        if let Some(correction) = self.custom_corrections.get(&lower) {
             return Some(self.preserve_case(word, correction));
         }
 
         // Check dictionary
-        if let Some(correction) = self.dictionary.get(&word.to_lowercase()) {
+        if let Some(correction) = self.dictionary.get(&lower) {
             return Some(self.preserve_case(word, correction));
         }
 
@@ -78,7 +86,7 @@ impl AutocorrectEngine {
     /// Apply autocorrect to text
     fn apply_autocorrect(&self, text: &str) -> Result<String> {
         let mut result = text.to_string();
-        let words: Vec<_> = self.word_boundary.find_iter(text).collect();
+        let words: Vec<_> = word_boundary().find_iter(text).collect();
 
         // Process in reverse to maintain correct indices
         for word_match in words.iter().rev() {
@@ -110,23 +118,38 @@ impl AutocorrectEngine {
     }
 
     /// Load custom corrections from config
-    fn load_custom_corrections(config: &Config) -> Result<HashMap<String, String>> {
-        Ok(config.custom_typos.clone())
+    ///
+    /// The entries are moved out rather than cloned: the engine keeps the only
+    /// copy, and nothing reads `custom_typos` back from its config.
+    fn load_custom_corrections(config: &mut Config) -> Result<HashMap<String, String>> {
+        Ok(std::mem::take(&mut config.custom_typos).into_iter().collect())
     }
 
     /// Update configuration
-    pub fn update_config(&mut self, config: Config) -> Result<()> {
-        self.custom_corrections = Self::load_custom_corrections(&config)?;
+    pub fn update_config(&mut self, mut config: Config) -> Result<()> {
+        self.custom_corrections = Self::load_custom_corrections(&mut config)?;
         self.config = config;
         Ok(())
     }
 
     /// Add custom correction
     pub fn add_custom_correction(&mut self, typo: &str, correction: &str) -> Result<()> {
-        self.custom_corrections.insert(
-            typo.to_lowercase(),
-            correction.to_string(),
-        );
+        self.add_custom_corrections([(typo, correction)])
+    }
+
+    /// Add several custom corrections, growing the table once up front
+    pub fn add_custom_corrections<'a, I>(&mut self, corrections: I) -> Result<()>
+    where
+        I: IntoIterator<Item = (&'a str, &'a str)>,
+    {
+        let corrections = corrections.into_iter();
+        self.custom_corrections.reserve(corrections.size_hint().0);
+        for (typo, correction) in corrections {
+            self.custom_corrections.insert(
+                typo.to_lowercase(),
+                correction.to_string(),
+            );
+        }
         Ok(())
     }
 
@@ -186,6 +209,18 @@ mod tests {
         assert!(result.contains("brown"));
     }
 
+    #[test]
+    fn test_bulk_custom_corrections() {
+        let mut engine = create_test_engine();
+        let before = engine.get_stats().custom_corrections;
+        engine
+            .add_custom_corrections([("Wrold", "world"), ("qiuck", "quick")])
+            .unwrap();
+        assert_eq!(engine.get_stats().custom_corrections, before + 2);
+        assert_eq!(engine.correct_word("wrold"), Some("world".to_string()));
+        assert_eq!(engine.correct_word("qiuck"), Some("quick".to_string()));
+    }
+
     #[test]
     fn test_min_word_length() {
         let mut config = Config::default();
@@ -68,6 +68,12 @@ impl SmartType {
         engine.add_custom_correction(typo, correction)
     }
 
+    /// Add several custom corrections at once
+    pub async fn add_corrections(&self, corrections: &[(&str, &str)]) -> Result<()> {
+        let mut engine = self.engine.write().await;
+        engine.add_custom_corrections(corrections.iter().copied())
+    }
+
     /// Remove custom correction
     pub async fn remove_correction(&self, typo: &str) -> Result<()> {
         let mut engine = self.engine.write().await;
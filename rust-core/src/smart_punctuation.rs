@@ -1,17 +1,17 @@
-use regex::Regex;
+/// Spaced double hyphen and its em dash replacement
+const DOUBLE_HYPHEN: &str = " -- ";
+const EM_DASH: &str = " — ";
+
+/// Three dots and their ellipsis replacement
+const THREE_DOTS: &str = "...";
+const ELLIPSIS: &str = "…";
 
 /// Smart punctuation processor
-pub struct SmartPunctuation {
-    dash_regex: Regex,
-    ellipsis_regex: Regex,
-}
+pub struct SmartPunctuation;
 
 impl SmartPunctuation {
     pub fn new() -> Self {
-        Self {
-            dash_regex: Regex::new(r" -- ").unwrap(),
-            ellipsis_regex: Regex::new(r"\.\.\.").unwrap(),
-        }
+        Self
     }
 
     /// Process text with smart punctuation
@@ -26,10 +26,10 @@ impl SmartPunctuation {
         result = self.fix_apostrophes(&result);
 
         // Replace double hyphens with em dash
-        result = self.dash_regex.replace_all(&result, " — ").to_string();
+        result = result.replace(DOUBLE_HYPHEN, EM_DASH);
 
         // Replace three dots with ellipsis
-        result = self.ellipsis_regex.replace_all(&result, "…").to_string();
+        result = result.replace(THREE_DOTS, ELLIPSIS);
 
         result
     }
@@ -67,8 +67,8 @@ echo "  smarttype-daemon — ok"
 
 echo ""
 echo "==> Stopping any running SmartType service..."
-systemctl --user stop smarttype.service 2>/dev/null || true
-systemctl --user disable smarttype.service 2>/dev/null || true
+# One systemctl call: `disable --now` stops the unit in the same transaction.
+systemctl --user disable --now smarttype.service 2>/dev/null || true
 # Kill any stray daemon/engine left running outside systemd so the binaries are
 # not held open (avoids "Text file busy" when we replace them below).
 pkill -x smarttype-daemon 2>/dev/null || true
@@ -142,8 +142,7 @@ WantedBy=default.target
 EOF
 
 systemctl --user daemon-reload
-systemctl --user enable smarttype.service
-systemctl --user start smarttype.service
+systemctl --user enable --now smarttype.service
 echo "  Service enabled and started."
 
 # ── Done ──────────────────────────────────────────────────────────────────────